@@ -1,18 +1,96 @@
-from flask import Flask, request, jsonify, send_from_directory
+import json
+import mimetypes
+import os
+import re
+
+import orjson
+from flask import Flask, Response, abort, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import generate_etag
 from backend.order_tracker import OrderTracker
 from backend.in_memory_storage import InMemoryStorage
 
+
+# Runs of digits long enough to hold an integer outside orjson's range
+_LONG_DIGITS = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+def _parse_int(text):
+    """Parses a JSON integer, rejecting values orjson cannot represent."""
+    value = int(text)
+    if not -2**63 <= value < 2**64:
+        raise ValueError("Integer exceeds 64-bit range")
+    return value
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        # orjson silently parses integers beyond 64 bits as floats, so
+        # documents that may contain one are parsed with the standard
+        # library, which rejects them via _parse_int.
+        pattern = _LONG_DIGITS_BYTES if isinstance(s, (bytes, bytearray)) else _LONG_DIGITS
+        if pattern.search(s):
+            return json.loads(s, parse_int=_parse_int)
+        return orjson.loads(s)
+
+
+def stream_json_array(items):
+    """Yields a JSON array one encoded item at a time."""
+    yield b"["
+    for index, item in enumerate(items):
+        if index:
+            yield b","
+        yield orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+    yield b"]\n"
+
+
+def load_static_files(folder):
+    """
+    Reads every file under folder into memory. Returns a dict mapping each
+    file's path relative to folder to its (body, mimetype, etag).
+    """
+    files = {}
+    for root, _, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, 'rb') as f:
+                body = f.read()
+            mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+            filename = os.path.relpath(path, folder).replace(os.sep, '/')
+            files[filename] = (body, mimetype, generate_etag(body))
+    return files
+
+
 app = Flask(__name__, static_folder='../frontend')
+app.json = OrjsonProvider(app)
 in_memory_storage = InMemoryStorage()
 order_tracker = OrderTracker(in_memory_storage)
 
+# The frontend is small, so serve it from memory. Changes to the files
+# take effect when the app is restarted.
+static_files = load_static_files(app.static_folder)
+
 @app.route('/')
 def serve_index():
-    return send_from_directory(app.static_folder, 'index.html')
+    return serve_static('index.html')
 
 @app.route('/<path:filename>')
 def serve_static(filename):
-    return send_from_directory(app.static_folder, filename)
+    if filename not in static_files:
+        abort(404)
+    body, mimetype, etag = static_files[filename]
+    response = Response(body, mimetype=mimetype, headers={"Cache-Control": "public, max-age=3600"})
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 @app.route('/api/orders', methods=['POST'])
 def add_order_api():
@@ -26,6 +104,14 @@ def add_order_api():
     )
     return jsonify({"order_id": data['order_id']}), 201
 
+@app.route('/api/orders:batch', methods=['POST'])
+def add_orders_batch_api():
+    data = request.get_json()
+    if not isinstance(data, list) or not data:
+        return jsonify({"error": "Request body must be a non-empty list of orders"}), 400
+    result = order_tracker.add_orders(data)
+    return jsonify(result), 201 if result["created"] else 400
+
 @app.route('/api/orders/<string:order_id>', methods=['GET'])
 def get_order_api(order_id):
     order = order_tracker.get_order_by_id(order_id)
@@ -51,8 +137,8 @@ def list_orders_api():
     if status:
         orders = order_tracker.list_orders_by_status(status)
     else:
-        orders = order_tracker.list_all_orders()
-    return jsonify(list(orders.values()) if isinstance(orders, dict) else orders), 200
+        orders = order_tracker.iter_orders()
+    return Response(stream_json_array(orders), status=200, mimetype='application/json')
 
 if __name__ == '__main__':
     app.run(host="0.0.0.0", port=8080, debug=True)
@@ -0,0 +1,19 @@
+# Gunicorn configuration for serving the Udatracker API.
+# Run from the starter directory:
+#   gunicorn -c backend/gunicorn.conf.py backend.wsgi:app
+
+import os
+
+bind = os.environ.get("UDATRACKER_BIND", "0.0.0.0:8080")
+
+# Threaded workers let one process keep serving requests while others wait.
+worker_class = "gthread"
+threads = int(os.environ.get("UDATRACKER_THREADS", "8"))
+
+# Orders live in process memory, so every worker would see its own copy of
+# the data. Keep a single worker until a shared storage backend is in place.
+workers = int(os.environ.get("UDATRACKER_WORKERS", "1"))
+
+# Import the app after forking so each worker builds its own OrderTracker
+# and storage instead of inheriting the master's.
+preload_app = False
@@ -1,22 +1,119 @@
 # This file provides a simple in-memory storage implementation for orders.
 # Data stored here will be lost when the application restarts.
 
+import threading
+
+# Column list attribute for each patchable order field
+_FIELD_COLUMNS = {
+    "item_name": "_item_names",
+    "quantity": "_quantities",
+    "customer_id": "_customer_ids",
+    "status": "_statuses",
+}
+
 class InMemoryStorage:
     """
     A simple in-memory implementation of the storage interface.
-    Stores orders in a Python dictionary.
+    Stores orders column by column: one list per order field, with a row
+    index keyed by order ID and a secondary index of rows keyed by status.
+    Order dicts are only built when they are returned to the caller.
+    Access is guarded by a lock so a single instance can be shared between
+    the threads of one server process.
     """
     def __init__(self):
-        self._orders = {}
+        self._lock = threading.RLock()
+        self.clear()
 
     def save_order(self, order_id: str, order_data: dict):
-        self._orders[order_id] = order_data.copy()
+        with self._lock:
+            status = order_data.get("status")
+            row = self._index.get(order_id)
+            if row is None:
+                row = len(self._ids)
+                self._index[order_id] = row
+                self._ids.append(order_id)
+                self._item_names.append(order_data.get("item_name"))
+                self._quantities.append(order_data.get("quantity"))
+                self._customer_ids.append(order_data.get("customer_id"))
+                self._statuses.append(status)
+            else:
+                self._by_status[self._statuses[row]].discard(row)
+                self._item_names[row] = order_data.get("item_name")
+                self._quantities[row] = order_data.get("quantity")
+                self._customer_ids[row] = order_data.get("customer_id")
+                self._statuses[row] = status
+            self._by_status.setdefault(status, set()).add(row)
+
+    def save_order_if_absent(self, order_id: str, order_data: dict) -> bool:
+        with self._lock:
+            if order_id in self._index:
+                return False
+            self.save_order(order_id, order_data)
+            return True
+
+    def save_orders_if_absent(self, orders: dict) -> list:
+        with self._lock:
+            saved = []
+            for order_id, order_data in orders.items():
+                if order_id not in self._index:
+                    self.save_order(order_id, order_data)
+                    saved.append(order_id)
+            return saved
+
+    def patch_order(self, order_id: str, delta: dict) -> bool:
+        with self._lock:
+            row = self._index.get(order_id)
+            if row is None:
+                return False
+            for field, value in delta.items():
+                column = _FIELD_COLUMNS.get(field)
+                if column is None:
+                    continue
+                if field == "status":
+                    self._by_status[self._statuses[row]].discard(row)
+                    self._by_status.setdefault(value, set()).add(row)
+                getattr(self, column)[row] = value
+            return True
 
     def get_order(self, order_id: str):
-        return self._orders.get(order_id, {}).copy() if self._orders.get(order_id) else None
+        with self._lock:
+            row = self._index.get(order_id)
+            return self._row(row) if row is not None else None
 
     def get_all_orders(self):
-        return {k: v.copy() for k, v in self._orders.items()}
+        with self._lock:
+            return {order_id: self._row(row) for order_id, row in self._index.items()}
+
+    def iter_orders(self):
+        with self._lock:
+            count = len(self._ids)
+        for row in range(count):
+            with self._lock:
+                # Stop early if the storage was cleared while iterating
+                if row >= len(self._ids):
+                    return
+                order = self._row(row)
+            yield order
+
+    def get_orders_by_status(self, status: str):
+        with self._lock:
+            return [self._row(row) for row in sorted(self._by_status.get(status, ()))]
 
     def clear(self):
-        self._orders = {}
+        with self._lock:
+            self._index = {}
+            self._ids = []
+            self._item_names = []
+            self._quantities = []
+            self._customer_ids = []
+            self._statuses = []
+            self._by_status = {}
+
+    def _row(self, row: int) -> dict:
+        return {
+            "order_id": self._ids[row],
+            "item_name": self._item_names[row],
+            "quantity": self._quantities[row],
+            "customer_id": self._customer_ids[row],
+            "status": self._statuses[row],
+        }
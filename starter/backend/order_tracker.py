@@ -1,27 +1,133 @@
 # This module contains the OrderTracker class, which encapsulates the core
 # business logic for managing orders.
 
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional
+
+_VALID_STATUSES = frozenset(("pending", "processing", "shipped", "delivered"))
+
+
+# Fields accepted for each order in add_orders
+_REQUIRED_ORDER_FIELDS = ("order_id", "item_name", "quantity", "customer_id")
+_ORDER_FIELDS = frozenset(_REQUIRED_ORDER_FIELDS + ("status",))
+
+
 class OrderTracker:
     """
     Manages customer orders, providing functionalities to add, update,
     and retrieve order information.
+
+    Storages exchange orders as plain dicts with the keys order_id,
+    item_name, quantity, customer_id and status: save_order receives a
+    dict, and get_order/get_all_orders return dicts.
     """
-    def __init__(self, storage):
-        required_methods = ['save_order', 'get_order', 'get_all_orders']
-        for method in required_methods:
-            if not hasattr(storage, method) or not callable(getattr(storage, method)):
-                raise TypeError(f"Storage object must implement a callable '{method}' method.")
-        self.storage = storage
-
-    def add_order(self, order_id: str, item_name: str, quantity: int, customer_id: str, status: str = "pending"):
-        # Check if the order already exists
-        if self.storage.get_order(order_id):
-            raise ValueError(f"Order with ID '{order_id}' already exists.")
-        
-        # Check if the quantity is valid
-        if quantity <= 0:
+    # Storage classes already known to implement the required methods
+    _validated_types: ClassVar[set] = set()
+
+    # Maximum number of orders kept in the get_order_by_id cache
+    cache_size: ClassVar[int] = 1024
+
+    def __init__(self, storage: Any) -> None:
+        storage_type = type(storage)
+        if storage_type not in OrderTracker._validated_types:
+            required_methods = ['save_order', 'get_order', 'get_all_orders']
+            for method in required_methods:
+                if not hasattr(storage, method) or not callable(getattr(storage, method)):
+                    raise TypeError(f"Storage object must implement a callable '{method}' method.")
+            # Only cache classes that define the methods themselves; duck-typed
+            # objects such as mocks may differ from instance to instance.
+            if all(callable(getattr(storage_type, method, None)) for method in required_methods):
+                OrderTracker._validated_types.add(storage_type)
+        self.storage: Any = storage
+
+        # Recently read orders, least recently used first. Writes made through
+        # the tracker evict the affected orders once the write has finished;
+        # writes that bypass it must call clear_cache().
+        self._cache: "OrderedDict[Any, dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_version: int = 0
+
+    def add_order(self, order_id: Any, item_name: Any, quantity: Any, customer_id: Any, status: Any = "pending") -> None:
+        order = self._build_order(order_id, item_name, quantity, customer_id, status)
+        try:
+            self._save_new_order(order["order_id"], order)
+        finally:
+            self._evict(order["order_id"])
+
+    def add_orders(self, orders: Iterable[Any]) -> Dict[str, list]:
+        """
+        Adds several orders at once. Every order is validated first, then all
+        valid orders are saved together. Returns a dict with the IDs of the
+        created orders and an error entry for each order that was rejected.
+        """
+        created: List[str] = []
+        errors: List[Dict[str, Any]] = []
+        pending: Dict[str, dict] = {}
+        indexes: Dict[str, int] = {}
+
+        # Validate every order before touching storage
+        for index, data in enumerate(orders):
+            try:
+                self._check_order_fields(data)
+                order = self._build_order(**data)
+                order_id = order["order_id"]
+                if order_id in pending:
+                    raise ValueError(f"Order with ID '{order_id}' already exists.")
+            except ValueError as e:
+                errors.append({"index": index, "error": str(e)})
+                continue
+            pending[order_id] = order
+            indexes[order_id] = index
+
+        # Save the valid orders, in one storage call when the storage supports it
+        try:
+            save_orders_if_absent = getattr(self.storage, "save_orders_if_absent", None)
+            if callable(save_orders_if_absent):
+                saved = set(save_orders_if_absent(pending))
+                for order_id in pending:
+                    if order_id in saved:
+                        created.append(order_id)
+                    else:
+                        errors.append({"index": indexes[order_id], "error": f"Order with ID '{order_id}' already exists."})
+            else:
+                for order_id, order in pending.items():
+                    try:
+                        self._save_new_order(order_id, order)
+                    except ValueError as e:
+                        errors.append({"index": indexes[order_id], "error": str(e)})
+                        continue
+                    created.append(order_id)
+        finally:
+            self._evict(*pending)
+
+        errors.sort(key=lambda error: error["index"])
+        return {"created": created, "errors": errors}
+
+    def _check_order_fields(self, data: Any) -> None:
+        # Check the shape of an order passed to add_orders, so that bad input
+        # is reported with a readable message rather than a Python error
+        if not isinstance(data, dict):
+            raise ValueError("Order must be an object")
+
+        missing = [field for field in _REQUIRED_ORDER_FIELDS if field not in data]
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}")
+
+        unknown = [str(field) for field in data if field not in _ORDER_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        for field in ("order_id", "item_name", "customer_id"):
+            if data[field] is not None and not isinstance(data[field], str):
+                raise ValueError(f"{field} must be a string")
+
+        quantity = data["quantity"]
+        if isinstance(quantity, bool) or not isinstance(quantity, int):
             raise ValueError("Quantity must be a positive integer")
-        
+
+    def _build_order(self, order_id: Any, item_name: Any, quantity: Any, customer_id: Any, status: Any = "pending") -> dict:
         # Check order_id is not empty
         if not order_id:
             raise ValueError("order_id cannot be empty")
@@ -33,58 +139,136 @@ class OrderTracker:
         # Check customer_id is not empty
         if not customer_id:
             raise ValueError("customer_id cannot be empty")
-    
-        # Check if the status is valid
-        if status and status not in ["pending", "processing", "shipped", "delivered"]:
+
+        # Check if the quantity is valid
+        if quantity <= 0:
+            raise ValueError("Quantity must be a positive integer")
+
+        # Check if the status is valid. Non-strings are rejected first, since
+        # unhashable values would make the set lookup raise TypeError.
+        if status and not (isinstance(status, str) and status in _VALID_STATUSES):
             raise ValueError("Invalid status")
         
-        # Save the order
-        self.storage.save_order(order_id, {
+        return {
             "order_id": order_id,
             "item_name": item_name,
             "quantity": quantity, 
             "customer_id": customer_id,
-            "status": status or "pending"
-        })
+            "status": sys.intern(status or "pending")
+        }
 
-    def get_order_by_id(self, order_id: str):
+    def _save_new_order(self, order_id: Any, order: dict) -> None:
+        # Save the order, checking that it does not already exist in a single
+        # storage call when the storage supports it
+        save_order_if_absent = getattr(self.storage, "save_order_if_absent", None)
+        if callable(save_order_if_absent):
+            if not save_order_if_absent(order_id, order):
+                raise ValueError(f"Order with ID '{order_id}' already exists.")
+            return
+
+        if self.storage.get_order(order_id):
+            raise ValueError(f"Order with ID '{order_id}' already exists.")
+        self.storage.save_order(order_id, order)
+
+    def get_order_by_id(self, order_id: Any) -> Optional[dict]:
         # Check if the order_id is not empty
         if not order_id:
             raise ValueError("order_id cannot be empty")
         
+        # Serve the order from the cache when possible
+        with self._cache_lock:
+            order = self._cache.get(order_id)
+            if order is not None:
+                self._cache.move_to_end(order_id)
+                return order.copy()
+            version = self._cache_version
+
         # Get the order
-        return self.storage.get_order(order_id)
+        order = self.storage.get_order(order_id)
+        if order:
+            with self._cache_lock:
+                # Skip caching if a write happened while reading from storage
+                if version == self._cache_version:
+                    self._cache[order_id] = order.copy()
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return order
 
-    def update_order_status(self, order_id: str, new_status: str):
+    def update_order_status(self, order_id: Any, new_status: Any) -> None:
 
         # Check if the order_id is not empty
         if not order_id:
             raise ValueError("order_id cannot be empty")
         
           # Check if the new_status is valid
-        if new_status and new_status not in ["pending", "processing", "shipped", "delivered"]:
+        if new_status and not (isinstance(new_status, str) and new_status in _VALID_STATUSES):
             raise ValueError("Invalid status")
 
-        order = self.get_order_by_id(order_id)
+        # Intern the status so equal statuses share one string object
+        status = sys.intern(new_status) if new_status else new_status
+
+        try:
+            self._write_status(order_id, status)
+        finally:
+            self._evict(order_id)
+
+    def _write_status(self, order_id: Any, status: Any) -> None:
+        # Update only the status field when the storage supports it
+        patch_order = getattr(self.storage, "patch_order", None)
+        if callable(patch_order):
+            if not patch_order(order_id, {"status": status}):
+                raise ValueError(f"Order with ID '{order_id}' not found")
+            return
+
+        order = self.storage.get_order(order_id)
         if not order:
             raise ValueError(f"Order with ID '{order_id}' not found")
 
-        order["status"] = new_status
+        order["status"] = status
 
         self.storage.save_order(order_id, order)
 
-    def list_all_orders(self):
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_version += 1
+
+    def _evict(self, *order_ids: Any) -> None:
+        # Called after a write, so a read that overlapped the write either
+        # gets dropped here or sees the version change and is not cached
+        with self._cache_lock:
+            for order_id in order_ids:
+                self._cache.pop(order_id, None)
+            self._cache_version += 1
+
+    def list_all_orders(self) -> Any:
         return self.storage.get_all_orders()
 
-    def list_orders_by_status(self, status: str):
+    def iter_orders(self) -> Iterator[dict]:
+        # Stream orders from the storage when it supports it
+        iter_orders = getattr(self.storage, "iter_orders", None)
+        if callable(iter_orders):
+            yield from iter_orders()
+            return
+
+        yield from self.storage.get_all_orders().values()
+
+    def list_orders_by_status(self, status: Any) -> List[dict]:
         # Check if the status is not empty
         if not status:
             raise ValueError("status cannot be empty")
         
         # Check if the status is valid
-        if status not in ["pending", "processing", "shipped", "delivered"]:
+        if not (isinstance(status, str) and status in _VALID_STATUSES):
             raise ValueError("Invalid status")
         
-        # Get the orders by status
+        # Use the storage's status index when it provides one
+        get_orders_by_status = getattr(self.storage, "get_orders_by_status", None)
+        if callable(get_orders_by_status):
+            return get_orders_by_status(status)
+
+        # Otherwise fall back to scanning all orders. Statuses written by the
+        # tracker are interned, so most comparisons are pointer checks.
+        status = sys.intern(status)
         orders = self.storage.get_all_orders()
         return [order for order in orders.values() if order["status"] == status]
@@ -1,11 +1,12 @@
 import pytest
-from backend.app import app, in_memory_storage
+from backend.app import app, in_memory_storage, order_tracker
 
 @pytest.fixture
 def client():
     app.config['TESTING'] = True
     app.config['DEBUG'] = False
     in_memory_storage.clear()
+    order_tracker.clear_cache()
     with app.test_client() as client:
         yield client
 
@@ -17,6 +18,49 @@ def test_add_order_api_success(client):
     assert response.status_code == 201
     assert response.json['order_id'] == "API001"
 
+def test_add_orders_batch_api(client):
+    response = client.post('/api/orders:batch', json=[
+        {"order_id": "B001", "item_name": "Item A", "quantity": 1, "customer_id": "C1"},
+        {"order_id": "B002", "item_name": "", "quantity": 1, "customer_id": "C2"},
+        {"order_id": "B003", "item_name": "Item C", "quantity": 3, "customer_id": "C3", "status": "shipped"},
+    ])
+    assert response.status_code == 201
+    assert response.json['created'] == ["B001", "B003"]
+    assert response.json['errors'] == [{"index": 1, "error": "item_name cannot be empty"}]
+    assert client.get('/api/orders/B003').json['status'] == "shipped"
+
+def test_add_orders_batch_api_rejects_non_list(client):
+    response = client.post('/api/orders:batch', json={"order_id": "B004"})
+    assert response.status_code == 400
+
+def test_add_orders_batch_api_rejects_empty_list(client):
+    response = client.post('/api/orders:batch', json=[])
+    assert response.status_code == 400
+    assert response.json == {"error": "Request body must be a non-empty list of orders"}
+
+def test_add_orders_batch_api_reports_unknown_fields(client):
+    response = client.post('/api/orders:batch', json=[
+        {"order_id": "B005", "item_name": "Item", "quantity": 1, "customer_id": "C5", "foo": "bar"},
+    ])
+    assert response.status_code == 400
+    assert response.json['errors'] == [{"index": 0, "error": "Unknown fields: foo"}]
+
+def test_add_order_api_rejects_integer_beyond_64_bits(client):
+    response = client.post(
+        '/api/orders',
+        data='{"order_id": "BIG001", "item_name": "Item", "quantity": 18446744073709551616, "customer_id": "C1"}',
+        content_type='application/json'
+    )
+    assert response.status_code == 400
+    assert client.get('/api/orders/BIG001').status_code == 404
+
+def test_add_order_api_accepts_long_digit_strings(client):
+    response = client.post('/api/orders', json={
+        "order_id": "12345678901234567890123", "item_name": "Item", "quantity": 2, "customer_id": "C1"
+    })
+    assert response.status_code == 201
+    assert client.get('/api/orders/12345678901234567890123').json['quantity'] == 2
+
 def test_get_order_api_success(client):
     client.post('/api/orders', json={
         "order_id": "GET001", "item_name": "Test Item", "quantity": 1, "customer_id": "C1"
@@ -44,6 +88,11 @@ def test_list_all_orders_api_with_data(client):
     assert response.status_code == 200
     assert len(response.json) == 2
 
+def test_list_all_orders_api_empty(client):
+    response = client.get('/api/orders')
+    assert response.status_code == 200
+    assert response.json == []
+
 def test_list_orders_by_status_api_matching(client):
     client.post('/api/orders', json={"order_id": "S001", "item_name": "A", "quantity": 1, "customer_id": "C1", "status": "pending"})
     client.post('/api/orders', json={"order_id": "S002", "item_name": "B", "quantity": 2, "customer_id": "C2", "status": "shipped"})
@@ -51,3 +100,26 @@ def test_list_orders_by_status_api_matching(client):
     assert response.status_code == 200
     assert len(response.json) == 1
     assert response.json[0]['order_id'] == "S001"
+
+def test_list_orders_by_status_api_after_update(client):
+    client.post('/api/orders', json={"order_id": "U001", "item_name": "A", "quantity": 1, "customer_id": "C1"})
+    client.put('/api/orders/U001/status', json={"new_status": "shipped"})
+    assert client.get('/api/orders?status=pending').json == []
+    response = client.get('/api/orders?status=shipped')
+    assert len(response.json) == 1
+    assert response.json[0]['order_id'] == "U001"
+
+def test_serve_index(client):
+    response = client.get('/')
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+    assert response.headers['ETag']
+
+def test_serve_static_not_modified(client):
+    etag = client.get('/css/style.css').headers['ETag']
+    response = client.get('/css/style.css', headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+def test_serve_static_not_found(client):
+    response = client.get('/missing.js')
+    assert response.status_code == 404
@@ -0,0 +1,198 @@
+import pytest
+from ..in_memory_storage import InMemoryStorage
+
+# --- Fixtures ---
+
+@pytest.fixture
+def storage():
+    """Provides an empty InMemoryStorage instance."""
+    return InMemoryStorage()
+
+
+def make_order(order_id, status="pending", item_name="Laptop", quantity=1):
+    return {
+        "order_id": order_id,
+        "item_name": item_name,
+        "quantity": quantity,
+        "customer_id": f"CUST-{order_id}",
+        "status": status
+    }
+
+
+# ==========================================
+# Tests for save_order and get_order
+# ==========================================
+
+def test_save_and_get_order(storage):
+    """Tests that a saved order is returned as an equal dict."""
+    # Act
+    storage.save_order("ORD001", make_order("ORD001"))
+
+    # Assert
+    assert storage.get_order("ORD001") == make_order("ORD001")
+    assert storage.get_order("ORD999") is None
+
+
+def test_get_order_returns_copy(storage):
+    """Tests that changing a returned order does not change the stored one."""
+    # Arrange
+    storage.save_order("ORD002", make_order("ORD002"))
+
+    # Act
+    storage.get_order("ORD002")["status"] = "shipped"
+
+    # Assert
+    assert storage.get_order("ORD002")["status"] == "pending"
+
+
+def test_save_order_overwrites_existing_order(storage):
+    """Tests that saving an existing order rewrites its row and moves it in the status index."""
+    # Arrange
+    storage.save_order("ORD003", make_order("ORD003"))
+    storage.save_order("ORD004", make_order("ORD004"))
+
+    # Act
+    storage.save_order("ORD003", make_order("ORD003", status="shipped", item_name="Mouse", quantity=4))
+
+    # Assert
+    assert storage.get_order("ORD003") == make_order("ORD003", status="shipped", item_name="Mouse", quantity=4)
+    assert [order["order_id"] for order in storage.get_orders_by_status("pending")] == ["ORD004"]
+    assert [order["order_id"] for order in storage.get_orders_by_status("shipped")] == ["ORD003"]
+    assert len(storage.get_all_orders()) == 2
+
+
+# ==========================================
+# Tests for save_order_if_absent and save_orders_if_absent
+# ==========================================
+
+def test_save_order_if_absent(storage):
+    """Tests that save_order_if_absent only saves orders that do not exist yet."""
+    # Act
+    first = storage.save_order_if_absent("ORD010", make_order("ORD010"))
+    second = storage.save_order_if_absent("ORD010", make_order("ORD010", item_name="Mouse"))
+
+    # Assert
+    assert first is True
+    assert second is False
+    assert storage.get_order("ORD010")["item_name"] == "Laptop"
+
+
+def test_save_orders_if_absent(storage):
+    """Tests that save_orders_if_absent saves new orders and skips existing ones."""
+    # Arrange
+    storage.save_order("ORD011", make_order("ORD011"))
+
+    # Act
+    saved = storage.save_orders_if_absent({
+        "ORD011": make_order("ORD011", item_name="Mouse"),
+        "ORD012": make_order("ORD012", status="shipped"),
+    })
+
+    # Assert
+    assert saved == ["ORD012"]
+    assert storage.get_order("ORD011")["item_name"] == "Laptop"
+    assert storage.get_order("ORD012") == make_order("ORD012", status="shipped")
+
+
+# ==========================================
+# Tests for patch_order
+# ==========================================
+
+def test_patch_order_moves_order_between_statuses(storage):
+    """Tests that patching the status updates the order and the status index."""
+    # Arrange
+    storage.save_order("ORD020", make_order("ORD020"))
+
+    # Act
+    patched = storage.patch_order("ORD020", {"status": "delivered"})
+
+    # Assert
+    assert patched is True
+    assert storage.get_order("ORD020")["status"] == "delivered"
+    assert storage.get_orders_by_status("pending") == []
+    assert storage.get_orders_by_status("delivered") == [make_order("ORD020", status="delivered")]
+
+
+def test_patch_order_ignores_unknown_fields(storage):
+    """Tests that patching only changes known order fields."""
+    # Arrange
+    storage.save_order("ORD021", make_order("ORD021"))
+
+    # Act
+    storage.patch_order("ORD021", {"quantity": 3, "order_id": "OTHER", "note": "x"})
+
+    # Assert
+    assert storage.get_order("ORD021") == make_order("ORD021", quantity=3)
+
+
+def test_patch_order_for_non_existent_order(storage):
+    """Tests that patching a missing order returns False."""
+    # Act & Assert
+    assert storage.patch_order("ORD999", {"status": "shipped"}) is False
+
+
+# ==========================================
+# Tests for get_orders_by_status
+# ==========================================
+
+def test_get_orders_by_status_keeps_insertion_order(storage):
+    """Tests that orders with a status are returned in the order they were added."""
+    # Arrange
+    for order_id, status in [("ORD030", "shipped"), ("ORD031", "pending"), ("ORD032", "shipped"), ("ORD033", "shipped")]:
+        storage.save_order(order_id, make_order(order_id, status=status))
+    storage.patch_order("ORD030", {"status": "pending"})
+    storage.patch_order("ORD030", {"status": "shipped"})
+
+    # Act
+    result = storage.get_orders_by_status("shipped")
+
+    # Assert
+    assert [order["order_id"] for order in result] == ["ORD030", "ORD032", "ORD033"]
+
+
+# ==========================================
+# Tests for iter_orders and clear
+# ==========================================
+
+def test_iter_orders(storage):
+    """Tests that iter_orders yields every order in insertion order."""
+    # Arrange
+    storage.save_order("ORD040", make_order("ORD040"))
+    storage.save_order("ORD041", make_order("ORD041", status="shipped"))
+
+    # Act
+    result = list(storage.iter_orders())
+
+    # Assert
+    assert result == [make_order("ORD040"), make_order("ORD041", status="shipped")]
+
+
+def test_iter_orders_stops_when_cleared(storage):
+    """Tests that iterating stops early if the storage is cleared part way through."""
+    # Arrange
+    for order_id in ("ORD042", "ORD043", "ORD044"):
+        storage.save_order(order_id, make_order(order_id))
+    orders = storage.iter_orders()
+
+    # Act
+    first = next(orders)
+    storage.clear()
+    rest = list(orders)
+
+    # Assert
+    assert first["order_id"] == "ORD042"
+    assert rest == []
+
+
+def test_clear(storage):
+    """Tests that clear removes every order and empties the status index."""
+    # Arrange
+    storage.save_order("ORD050", make_order("ORD050"))
+
+    # Act
+    storage.clear()
+
+    # Assert
+    assert storage.get_order("ORD050") is None
+    assert storage.get_all_orders() == {}
+    assert storage.get_orders_by_status("pending") == []
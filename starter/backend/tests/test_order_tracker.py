@@ -1,3 +1,5 @@
+import sys
+import threading
 import pytest
 from unittest.mock import Mock
 from ..order_tracker import OrderTracker
@@ -10,7 +12,7 @@ def mock_storage():
     Provides a mock storage object for tests.
     This mock will be configured to simulate various storage behaviors.
     """
-    mock = Mock()
+    mock = Mock(spec=["save_order", "get_order", "get_all_orders"])
     # By default, mock get_order to return None (no order found)
     mock.get_order.return_value = None
     # By default, mock get_all_orders to return an empty dict
@@ -25,6 +27,42 @@ def order_tracker(mock_storage):
     return OrderTracker(mock_storage)
 
 
+class DictStorage:
+    """A minimal storage that keeps and returns whatever it is given."""
+    def __init__(self):
+        self.orders = {}
+
+    def save_order(self, order_id, order_data):
+        self.orders[order_id] = order_data
+
+    def get_order(self, order_id):
+        return self.orders.get(order_id)
+
+    def get_all_orders(self):
+        return dict(self.orders)
+
+
+# ==========================================
+# Tests for __init__
+# ==========================================
+
+def test_init_with_storage_missing_method():
+    """Tests that a storage object without a required method raises a TypeError."""
+    # Act & Assert
+    with pytest.raises(TypeError, match="callable 'get_all_orders' method"):
+        OrderTracker(Mock(spec=["save_order", "get_order"]))
+
+
+def test_init_does_not_cache_duck_typed_storage(mock_storage):
+    """Tests that validating one mock does not let an incomplete mock through."""
+    # Arrange
+    OrderTracker(mock_storage)
+
+    # Act & Assert
+    with pytest.raises(TypeError, match="callable 'save_order' method"):
+        OrderTracker(Mock(spec=["get_order", "get_all_orders"]))
+
+
 # ==========================================
 # Tests for add_order
 # ==========================================
@@ -48,6 +86,30 @@ def test_add_order_raises_error_if_exists(order_tracker, mock_storage):
         order_tracker.add_order("ORD_EXISTING", "New Item", 1, "CUST001")
 
 
+def test_add_order_uses_save_order_if_absent(order_tracker, mock_storage):
+    """Tests that a storage providing save_order_if_absent is used in a single call."""
+    # Arrange
+    mock_storage.save_order_if_absent = Mock(return_value=True)
+
+    # Act
+    order_tracker.add_order("ORD010", "Laptop", 1, "CUST010")
+
+    # Assert
+    mock_storage.save_order_if_absent.assert_called_once()
+    mock_storage.get_order.assert_not_called()
+    mock_storage.save_order.assert_not_called()
+
+
+def test_add_order_raises_error_if_save_order_if_absent_fails(order_tracker, mock_storage):
+    """Tests that a rejected save_order_if_absent is reported as a duplicate order."""
+    # Arrange
+    mock_storage.save_order_if_absent = Mock(return_value=False)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Order with ID 'ORD011' already exists."):
+        order_tracker.add_order("ORD011", "Laptop", 1, "CUST011")
+
+
 def test_add_order_with_explicit_status(order_tracker, mock_storage):
     """Tests adding a new order with an explicitly set valid status."""
     # Act
@@ -57,6 +119,27 @@ def test_add_order_with_explicit_status(order_tracker, mock_storage):
     mock_storage.save_order.assert_called_once()
     saved_order = mock_storage.save_order.call_args[0][1]
     assert saved_order['status'] == "processing"
+    assert saved_order['status'] is sys.intern("processing")
+
+
+def test_add_order_with_float_quantity(order_tracker, mock_storage):
+    """Tests that a positive non-integer quantity is accepted, as it is not type-checked."""
+    # Act
+    order_tracker.add_order("ORD012", "Cable", 1.5, "CUST012")
+
+    # Assert
+    saved_order = mock_storage.save_order.call_args[0][1]
+    assert saved_order['quantity'] == 1.5
+
+
+def test_add_order_with_non_string_order_id(order_tracker, mock_storage):
+    """Tests that a non-empty order_id of another type is accepted, as it is not type-checked."""
+    # Act
+    order_tracker.add_order(5, "Cable", 1, "CUST013")
+
+    # Assert
+    saved_order = mock_storage.save_order.call_args[0][1]
+    assert saved_order['order_id'] == 5
 
 
 def test_add_order_with_invalid_quantity_zero(order_tracker, mock_storage):
@@ -73,6 +156,17 @@ def test_add_order_with_invalid_quantity_negative(order_tracker, mock_storage):
         order_tracker.add_order("ORD004", "Monitor", -5, "CUST004")
 
 
+def test_add_order_with_invalid_quantity_does_not_touch_storage(order_tracker, mock_storage):
+    """Tests that an invalid quantity raises ValueError before checking storage."""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Quantity must be a positive integer"):
+        order_tracker.add_order("ORD005", "Monitor", 0, "CUST005")
+
+    # Assert (verify fail-fast behavior - no storage read or write)
+    mock_storage.get_order.assert_not_called()
+    mock_storage.save_order.assert_not_called()
+
+
 def test_add_order_with_empty_order_id(order_tracker, mock_storage):
     """Tests that adding an order with empty order_id raises a ValueError."""
     # Act & Assert
@@ -108,6 +202,78 @@ def test_add_order_with_invalid_initial_status(order_tracker, mock_storage):
         order_tracker.add_order("ORD008", "Speaker", 1, "CUST008", status="invalid_status")
 
 
+def test_add_order_with_non_string_status(order_tracker, mock_storage):
+    """Tests that adding an order with a non-string status raises a ValueError."""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid status"):
+        order_tracker.add_order("ORD009", "Speaker", 1, "CUST009", status=["pending"])
+
+
+# ==========================================
+# Tests for add_orders
+# ==========================================
+
+def test_add_orders_saves_valid_orders_and_reports_errors(order_tracker, mock_storage):
+    """Tests that valid orders are saved and invalid ones are reported by index."""
+    # Act
+    result = order_tracker.add_orders([
+        {"order_id": "ORD050", "item_name": "Laptop", "quantity": 1, "customer_id": "CUST050"},
+        {"order_id": "ORD051", "item_name": "Mouse", "quantity": 0, "customer_id": "CUST051"},
+        {"order_id": "ORD050", "item_name": "Laptop", "quantity": 1, "customer_id": "CUST050"},
+    ])
+
+    # Assert
+    assert result["created"] == ["ORD050"]
+    assert result["errors"] == [
+        {"index": 1, "error": "Quantity must be a positive integer"},
+        {"index": 2, "error": "Order with ID 'ORD050' already exists."},
+    ]
+    mock_storage.save_order.assert_called_once()
+
+
+def test_add_orders_reports_malformed_orders(order_tracker, mock_storage):
+    """Tests that malformed orders are rejected with readable messages."""
+    # Act
+    result = order_tracker.add_orders([
+        "ORD054",
+        {"order_id": "ORD055", "item_name": "Laptop", "quantity": 1},
+        {"order_id": "ORD056", "item_name": "Laptop", "quantity": 1, "customer_id": "CUST056", "foo": 1},
+        {"order_id": 57, "item_name": "Laptop", "quantity": 1, "customer_id": "CUST057"},
+        {"order_id": "ORD058", "item_name": "Laptop", "quantity": "1", "customer_id": "CUST058"},
+        {"order_id": "ORD059", "item_name": "Laptop", "quantity": 1, "customer_id": "CUST059", "status": ["pending"]},
+    ])
+
+    # Assert
+    assert result["created"] == []
+    assert result["errors"] == [
+        {"index": 0, "error": "Order must be an object"},
+        {"index": 1, "error": "Missing fields: customer_id"},
+        {"index": 2, "error": "Unknown fields: foo"},
+        {"index": 3, "error": "order_id must be a string"},
+        {"index": 4, "error": "Quantity must be a positive integer"},
+        {"index": 5, "error": "Invalid status"},
+    ]
+    mock_storage.save_order.assert_not_called()
+
+
+def test_add_orders_uses_save_orders_if_absent(order_tracker, mock_storage):
+    """Tests that a storage providing save_orders_if_absent saves the batch in one call."""
+    # Arrange
+    mock_storage.save_orders_if_absent = Mock(return_value=["ORD052"])
+
+    # Act
+    result = order_tracker.add_orders([
+        {"order_id": "ORD052", "item_name": "Laptop", "quantity": 1, "customer_id": "CUST052"},
+        {"order_id": "ORD053", "item_name": "Mouse", "quantity": 1, "customer_id": "CUST053"},
+    ])
+
+    # Assert
+    mock_storage.save_orders_if_absent.assert_called_once()
+    mock_storage.save_order.assert_not_called()
+    assert result["created"] == ["ORD052"]
+    assert result["errors"] == [{"index": 1, "error": "Order with ID 'ORD053' already exists."}]
+
+
 # ==========================================
 # Tests for get_order_by_id
 # ==========================================
@@ -145,6 +311,67 @@ def test_get_order_by_id_non_existent_order(order_tracker, mock_storage):
     mock_storage.get_order.assert_called_once_with("ORD999")
 
 
+def test_get_order_by_id_is_cached(order_tracker, mock_storage):
+    """Tests that repeated reads of the same order only hit storage once."""
+    # Arrange
+    mock_storage.get_order.return_value = {"order_id": "ORD101", "status": "pending"}
+
+    # Act
+    first = order_tracker.get_order_by_id("ORD101")
+    second = order_tracker.get_order_by_id("ORD101")
+
+    # Assert
+    assert first == second
+    mock_storage.get_order.assert_called_once_with("ORD101")
+
+
+def test_get_order_by_id_cache_evicted_on_update(order_tracker, mock_storage):
+    """Tests that updating an order's status evicts it from the cache."""
+    # Arrange
+    mock_storage.get_order.return_value = {"order_id": "ORD102", "status": "pending"}
+    order_tracker.get_order_by_id("ORD102")
+
+    # Act
+    order_tracker.update_order_status("ORD102", "shipped")
+    mock_storage.get_order.return_value = {"order_id": "ORD102", "status": "shipped"}
+    result = order_tracker.get_order_by_id("ORD102")
+
+    # Assert
+    assert result["status"] == "shipped"
+
+
+def test_get_order_by_id_read_during_update_is_not_cached():
+    """Tests that a read overlapping a status update does not cache the old order."""
+    # Arrange
+    patch_started = threading.Event()
+    release_patch = threading.Event()
+    stored = {"order_id": "ORD103", "status": "pending"}
+
+    def patch_order(order_id, delta):
+        patch_started.set()
+        release_patch.wait(timeout=5)
+        stored.update(delta)
+        return True
+
+    storage = Mock(spec=["save_order", "get_order", "get_all_orders", "patch_order"])
+    storage.get_order.side_effect = lambda order_id: dict(stored)
+    storage.patch_order.side_effect = patch_order
+    tracker = OrderTracker(storage)
+
+    # Act
+    writer = threading.Thread(target=tracker.update_order_status, args=("ORD103", "shipped"))
+    writer.start()
+    assert patch_started.wait(timeout=5)
+    during = tracker.get_order_by_id("ORD103")
+    release_patch.set()
+    writer.join(timeout=5)
+    after = tracker.get_order_by_id("ORD103")
+
+    # Assert
+    assert during["status"] == "pending"
+    assert after["status"] == "shipped"
+
+
 def test_get_order_by_id_with_empty_id(order_tracker, mock_storage):
     """Tests that retrieving an order with empty ID raises a ValueError."""
     # Act & Assert
@@ -184,6 +411,31 @@ def test_update_order_status_successfully(order_tracker, mock_storage):
     updated_order = mock_storage.save_order.call_args[0][1]
     assert updated_order["status"] == "shipped"
 
+
+def test_update_order_status_uses_patch_order(order_tracker, mock_storage):
+    """Tests that a storage providing patch_order only receives the changed status."""
+    # Arrange
+    mock_storage.patch_order = Mock(return_value=True)
+
+    # Act
+    order_tracker.update_order_status("ORD202", "delivered")
+
+    # Assert
+    mock_storage.patch_order.assert_called_once_with("ORD202", {"status": "delivered"})
+    mock_storage.get_order.assert_not_called()
+    mock_storage.save_order.assert_not_called()
+
+
+def test_update_order_status_with_patch_order_for_non_existent_order(order_tracker, mock_storage):
+    """Tests that a failed patch_order is reported as a missing order."""
+    # Arrange
+    mock_storage.patch_order = Mock(return_value=False)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Order with ID 'ORD998' not found"):
+        order_tracker.update_order_status("ORD998", "shipped")
+
+
 def test_update_order_status_with_invalid_status(order_tracker, mock_storage):
     """Tests that updating to an invalid status raises ValueError before checking storage."""
     # Act & Assert
@@ -194,6 +446,15 @@ def test_update_order_status_with_invalid_status(order_tracker, mock_storage):
     mock_storage.get_order.assert_not_called()
 
 
+def test_update_order_status_with_non_string_status(order_tracker, mock_storage):
+    """Tests that updating to a non-string status raises ValueError before checking storage."""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid status"):
+        order_tracker.update_order_status("ORD203", {"status": "shipped"})
+
+    mock_storage.get_order.assert_not_called()
+
+
 def test_update_order_status_for_non_existent_order(order_tracker, mock_storage):
     """Tests that updating a non-existent order raises a ValueError."""
     # Arrange
@@ -264,6 +525,37 @@ def test_list_all_orders_multiple_orders(order_tracker, mock_storage):
     assert all(order in result.values() for order in orders_dict.values())
 
 
+# ==========================================
+# Tests for iter_orders
+# ==========================================
+
+def test_iter_orders_falls_back_to_get_all_orders(order_tracker, mock_storage):
+    """Tests iterating orders from a storage without an iter_orders method."""
+    # Arrange
+    order = {"order_id": "ORD350", "status": "pending"}
+    mock_storage.get_all_orders.return_value = {"ORD350": order}
+
+    # Act
+    result = list(order_tracker.iter_orders())
+
+    # Assert
+    assert result == [order]
+
+
+def test_iter_orders_uses_storage_iter_orders(order_tracker, mock_storage):
+    """Tests that a storage providing iter_orders is streamed from directly."""
+    # Arrange
+    order = {"order_id": "ORD351", "status": "pending"}
+    mock_storage.iter_orders = Mock(return_value=iter([order]))
+
+    # Act
+    result = list(order_tracker.iter_orders())
+
+    # Assert
+    assert result == [order]
+    mock_storage.get_all_orders.assert_not_called()
+
+
 # ==========================================
 # Tests for list_orders_by_status
 # ==========================================
@@ -339,6 +631,21 @@ def test_list_orders_by_status_empty_storage(order_tracker, mock_storage):
     assert result == []
 
 
+def test_list_orders_by_status_uses_storage_index(order_tracker, mock_storage):
+    """Tests that a storage providing get_orders_by_status is queried instead of scanned."""
+    # Arrange
+    expected = [{"order_id": "ORD600", "status": "pending"}]
+    mock_storage.get_orders_by_status = Mock(return_value=expected)
+
+    # Act
+    result = order_tracker.list_orders_by_status("pending")
+
+    # Assert
+    assert result == expected
+    mock_storage.get_orders_by_status.assert_called_once_with("pending")
+    mock_storage.get_all_orders.assert_not_called()
+
+
 def test_list_orders_by_status_with_empty_status(order_tracker, mock_storage):
     """Tests that listing orders with empty status raises a ValueError."""
     # Act & Assert
@@ -351,3 +658,39 @@ def test_list_orders_by_status_with_invalid_status(order_tracker, mock_storage):
     # Act & Assert
     with pytest.raises(ValueError, match="Invalid status"):
         order_tracker.list_orders_by_status("invalid_status")
+
+
+def test_list_orders_by_status_with_non_string_status(order_tracker, mock_storage):
+    """Tests that listing orders with a non-string status raises a ValueError."""
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid status"):
+        order_tracker.list_orders_by_status(["shipped"])
+
+
+# ==========================================
+# Tests with a minimal storage
+# ==========================================
+
+def test_order_tracker_with_minimal_storage():
+    """Tests the full order lifecycle against a storage that only has the required methods."""
+    # Arrange
+    storage = DictStorage()
+    tracker = OrderTracker(storage)
+
+    # Act
+    tracker.add_order("ORD700", "Laptop", 1, "CUST700")
+    tracker.add_orders([{"order_id": "ORD701", "item_name": "Mouse", "quantity": 2, "customer_id": "CUST701"}])
+    tracker.update_order_status("ORD700", "shipped")
+
+    # Assert
+    assert storage.orders["ORD700"] == {
+        "order_id": "ORD700",
+        "item_name": "Laptop",
+        "quantity": 1,
+        "customer_id": "CUST700",
+        "status": "shipped"
+    }
+    assert tracker.get_order_by_id("ORD700")["status"] == "shipped"
+    assert tracker.get_order_by_id("ORD701")["status"] == "pending"
+    assert [order["order_id"] for order in tracker.list_orders_by_status("shipped")] == ["ORD700"]
+    assert len(list(tracker.iter_orders())) == 2
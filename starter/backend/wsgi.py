@@ -0,0 +1,4 @@
+# WSGI entry point for running the API under a production server, e.g.
+#   gunicorn -c backend/gunicorn.conf.py backend.wsgi:app
+
+from backend.app import app